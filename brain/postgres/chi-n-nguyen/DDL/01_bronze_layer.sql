@@ -27,6 +27,22 @@ CREATE TABLE bronze.raw_conversations (
     processing_status VARCHAR(20) DEFAULT 'pending'
 );
 
+-- =====================================================================
+-- METHOD DIMENSION TABLE
+-- =====================================================================
+-- Small lookup table so fact rows carry a 2-byte method code instead of
+-- a variable-length processing_method string on every row
+CREATE TABLE bronze.method_dim (
+    id SMALLINT PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+INSERT INTO bronze.method_dim (id, name) VALUES
+    (1, 'RAG'),
+    (2, 'CONTEXT_DUMP'),
+    (3, 'HYBRID')
+ON CONFLICT (id) DO NOTHING;
+
 -- =====================================================================
 -- RAW QUERIES TABLE
 -- =====================================================================
@@ -41,6 +57,7 @@ CREATE TABLE bronze.raw_queries (
     response_timestamp TIMESTAMP WITH TIME ZONE,
     response_metadata JSONB,
     processing_method VARCHAR(20) CHECK (processing_method IN ('RAG', 'CONTEXT_DUMP')),
+    method_id SMALLINT REFERENCES bronze.method_dim(id),
     response_time_ms INTEGER,
     tokens_used INTEGER,
     cost_usd DECIMAL(10,6),
@@ -49,6 +66,27 @@ CREATE TABLE bronze.raw_queries (
     is_processed BOOLEAN DEFAULT FALSE
 );
 
+-- Keep method_id in sync on the write path: writers only set
+-- processing_method, so derive the code for every insert and for any
+-- update that changes the method string
+CREATE OR REPLACE FUNCTION bronze.set_raw_query_method_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.processing_method IS NOT NULL THEN
+        SELECT id INTO NEW.method_id
+        FROM bronze.method_dim
+        WHERE name = NEW.processing_method;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_bronze_raw_queries_method_id ON bronze.raw_queries;
+CREATE TRIGGER trg_bronze_raw_queries_method_id
+    BEFORE INSERT OR UPDATE OF processing_method ON bronze.raw_queries
+    FOR EACH ROW
+    EXECUTE FUNCTION bronze.set_raw_query_method_id();
+
 -- =====================================================================
 -- RAW PERFORMANCE_METRICS TABLE
 -- =====================================================================
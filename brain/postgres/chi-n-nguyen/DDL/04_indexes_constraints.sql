@@ -16,15 +16,76 @@ SET search_path TO gold, silver, bronze, public;
 CREATE INDEX IF NOT EXISTS idx_bronze_raw_queries_timestamp 
     ON bronze.raw_queries(query_timestamp DESC);
 
-CREATE INDEX IF NOT EXISTS idx_bronze_raw_queries_processing_method 
+CREATE INDEX IF NOT EXISTS idx_bronze_raw_queries_processing_method
     ON bronze.raw_queries(processing_method);
 
+-- Smallint method code migration: idempotent so this file can run
+-- against databases created before bronze.method_dim existed
+CREATE TABLE IF NOT EXISTS bronze.method_dim (
+    id SMALLINT PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+
+INSERT INTO bronze.method_dim (id, name) VALUES
+    (1, 'RAG'),
+    (2, 'CONTEXT_DUMP'),
+    (3, 'HYBRID')
+ON CONFLICT (id) DO NOTHING;
+
+ALTER TABLE bronze.raw_queries
+    ADD COLUMN IF NOT EXISTS method_id SMALLINT REFERENCES bronze.method_dim(id);
+
+-- Backfill the code for rows ingested before the column existed
+UPDATE bronze.raw_queries rq
+SET method_id = md.id
+FROM bronze.method_dim md
+WHERE rq.method_id IS NULL
+  AND rq.processing_method = md.name;
+
+-- Keep method_id in sync on the write path: writers only set
+-- processing_method, so derive the code for every insert and for any
+-- update that changes the method string (idempotent re-create so this
+-- migration also covers databases built before the trigger existed)
+CREATE OR REPLACE FUNCTION bronze.set_raw_query_method_id()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.processing_method IS NOT NULL THEN
+        SELECT id INTO NEW.method_id
+        FROM bronze.method_dim
+        WHERE name = NEW.processing_method;
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trg_bronze_raw_queries_method_id ON bronze.raw_queries;
+CREATE TRIGGER trg_bronze_raw_queries_method_id
+    BEFORE INSERT OR UPDATE OF processing_method ON bronze.raw_queries
+    FOR EACH ROW
+    EXECUTE FUNCTION bronze.set_raw_query_method_id();
+
+-- Smallint method code: integer-equality comparisons for the analysis
+-- queries, 2 bytes per row on the wire instead of the method string
+CREATE INDEX IF NOT EXISTS idx_bronze_raw_queries_method_id
+    ON bronze.raw_queries(method_id);
+
 CREATE INDEX IF NOT EXISTS idx_bronze_raw_performance_method_time 
     ON bronze.raw_performance_metrics(processing_method, response_time_ms);
 
-CREATE INDEX IF NOT EXISTS idx_bronze_raw_performance_timestamp 
+CREATE INDEX IF NOT EXISTS idx_bronze_raw_performance_timestamp
     ON bronze.raw_performance_metrics(timestamp DESC);
 
+-- Partial indexes per method code so FILTER (WHERE method_id = ...)
+-- aggregations in the RAG vs Context Dumping analysis use index-only
+-- scans; predicates match the integer filters the analysis query sends
+CREATE INDEX IF NOT EXISTS idx_bronze_raw_queries_rag_metrics
+    ON bronze.raw_queries(response_time_ms, cost_usd)
+    WHERE method_id = 1;
+
+CREATE INDEX IF NOT EXISTS idx_bronze_raw_queries_context_metrics
+    ON bronze.raw_queries(response_time_ms, cost_usd)
+    WHERE method_id = 2;
+
 -- =====================================================================
 -- SILVER LAYER INDEXES
 -- =====================================================================
@@ -91,6 +91,18 @@ INSERT INTO bronze.raw_performance_metrics (
 ('880e8400-e29b-41d4-a716-446655440011'::UUID, '660e8400-e29b-41d4-a716-446655440011'::UUID, 'CONTEXT_DUMP', 97500, 15420, 0.771, 0.68, 2),
 ('880e8400-e29b-41d4-a716-446655440012'::UUID, '660e8400-e29b-41d4-a716-446655440012'::UUID, 'CONTEXT_DUMP', 135200, 18950, 0.9475, 0.61, 2);
 
+-- =====================================================================
+-- METHOD DIMENSION BACKFILL
+-- =====================================================================
+
+-- Backfill the smallint method code so downstream reads compare and
+-- ship 2-byte integers instead of the processing_method string
+UPDATE bronze.raw_queries rq
+SET method_id = md.id
+FROM bronze.method_dim md
+WHERE rq.method_id IS NULL
+  AND rq.processing_method = md.name;
+
 -- =====================================================================
 -- DATA VALIDATION AND SUMMARY
 -- =====================================================================
@@ -8,14 +8,20 @@ Description: Enterprise-grade Brain Architecture processor with Medallion patter
 
 import asyncio
 import asyncpg
-import pandas as pd
+import numpy as np
+import pyarrow as pa
 import logging
-import json
+import time
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; NumPy path covers small inputs
+    njit = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -23,12 +29,91 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Timestamp cache at 1s granularity: repeated analyses within the same
+# second reuse the formatted string instead of allocating a datetime
+_ts_cache = (0, "")
+
+def _iso_now() -> str:
+    """Current ISO-8601 timestamp, cached per second"""
+    global _ts_cache
+    sec = time.time_ns() // 1_000_000_000
+    if sec != _ts_cache[0]:
+        _ts_cache = (sec, datetime.fromtimestamp(sec).isoformat())
+    return _ts_cache[1]
+
+def _roi_percent(performance_factor, cost_factor):
+    """
+    Business-value ROI: performance x cost x 20, capped at 900%
+
+    Accepts scalars or NumPy arrays: batched factor arrays (e.g. one per
+    customer segment) evaluate through np.minimum in one SIMD pass, while
+    the single-summary case keeps the plain Python path.
+    """
+    if isinstance(performance_factor, np.ndarray):
+        return np.minimum(performance_factor * cost_factor * 20.0, 900.0)
+    return min(float(performance_factor) * float(cost_factor) * 20, 900)
+
+# Below this row count the JIT dispatch overhead outweighs the parallel loop
+_NUMBA_DISPATCH_THRESHOLD = 100_000
+
+def _method_group_means(method_ids: np.ndarray, response_times: np.ndarray,
+                        costs: np.ndarray, qualities: np.ndarray,
+                        n_methods: int) -> np.ndarray:
+    """
+    Per-method mean of (response_time, cost, quality) over dense-encoded
+    method ids. One pass, no pandas groupby machinery.
+    """
+    sums = np.zeros((n_methods, 3))
+    counts = np.zeros(n_methods, np.int64)
+    for i in range(method_ids.size):
+        m = method_ids[i]
+        sums[m, 0] += response_times[i]
+        sums[m, 1] += costs[i]
+        sums[m, 2] += qualities[i]
+        counts[m] += 1
+    counts = np.maximum(counts, 1)
+    return sums / counts.reshape(-1, 1)
+
+if njit is not None:
+    # Parallel variant: each thread owns one method's accumulators, so
+    # there are no write races; worthwhile once row counts are large
+    @njit(parallel=True, cache=True)
+    def _method_group_means_jit(method_ids, response_times, costs, qualities, n_methods):
+        sums = np.zeros((n_methods, 3))
+        counts = np.zeros(n_methods, np.int64)
+        for m in prange(n_methods):
+            for i in range(method_ids.size):
+                if method_ids[i] == m:
+                    sums[m, 0] += response_times[i]
+                    sums[m, 1] += costs[i]
+                    sums[m, 2] += qualities[i]
+                    counts[m] += 1
+            if counts[m] == 0:
+                counts[m] = 1
+        return sums / counts.reshape(-1, 1)
+else:
+    _method_group_means_jit = None
+
+def _group_means(method_ids: np.ndarray, response_times: np.ndarray,
+                 costs: np.ndarray, qualities: np.ndarray,
+                 n_methods: int) -> np.ndarray:
+    """Dispatch between the NumPy and parallel JIT kernels on input size"""
+    if _method_group_means_jit is not None and method_ids.size >= _NUMBA_DISPATCH_THRESHOLD:
+        return _method_group_means_jit(method_ids, response_times, costs, qualities, n_methods)
+    return _method_group_means(method_ids, response_times, costs, qualities, n_methods)
+
 class ProcessingMethod(Enum):
     """Enumeration for AI processing methods"""
     RAG = "RAG"
     CONTEXT_DUMP = "CONTEXT_DUMP"
     HYBRID = "HYBRID"
 
+# Smallint codes mirroring bronze.method_dim: server-side comparisons
+# become integer equality and joined rows ship 2 bytes per method value
+# instead of the variable-length name string
+METHOD_IDS = {'RAG': 1, 'CONTEXT_DUMP': 2, 'HYBRID': 3}
+METHOD_NAMES = {code: name for name, code in METHOD_IDS.items()}
+
 @dataclass
 class PerformanceMetrics:
     """Data class for performance metrics"""
@@ -48,33 +133,212 @@ class BusinessIntelligence:
     user_satisfaction_avg: float
     market_position_score: float
 
+# Dense codes for ProcessingMethod so the SoA batches store int8 columns
+_METHOD_CODES = {method: np.int8(i) for i, method in enumerate(ProcessingMethod)}
+_METHODS_BY_CODE = list(ProcessingMethod)
+
+class PerformanceMetricsBatch:
+    """
+    Structure-of-arrays batch of PerformanceMetrics
+
+    Holds one contiguous NumPy column per field instead of one Python
+    object per row, so aggregation loops avoid pointer chasing and the
+    columns feed numba kernels or Arrow tables without conversion. The
+    PerformanceMetrics dataclass remains the per-row cursor API.
+    """
+
+    __slots__ = ('response_time_ms', 'cost_usd', 'quality_score',
+                 'user_satisfaction', 'tokens_used', 'processing_method')
+
+    def __init__(self):
+        self.response_time_ms = np.empty(0, np.int32)
+        self.cost_usd = np.empty(0, np.float64)
+        self.quality_score = np.empty(0, np.float32)
+        self.user_satisfaction = np.empty(0, np.int8)
+        self.tokens_used = np.empty(0, np.int32)
+        self.processing_method = np.empty(0, np.int8)
+
+    def __len__(self) -> int:
+        return self.response_time_ms.size
+
+    def append_batch(self, records: List[PerformanceMetrics]) -> None:
+        """Append a batch of records, one concatenate per column"""
+        n = len(records)
+        if n == 0:
+            return
+        self.response_time_ms = np.concatenate([
+            self.response_time_ms,
+            np.fromiter((r.response_time_ms for r in records), np.int32, n)
+        ])
+        self.cost_usd = np.concatenate([
+            self.cost_usd,
+            np.fromiter((r.cost_usd for r in records), np.float64, n)
+        ])
+        self.quality_score = np.concatenate([
+            self.quality_score,
+            np.fromiter((r.quality_score for r in records), np.float32, n)
+        ])
+        self.user_satisfaction = np.concatenate([
+            self.user_satisfaction,
+            np.fromiter((r.user_satisfaction for r in records), np.int8, n)
+        ])
+        self.tokens_used = np.concatenate([
+            self.tokens_used,
+            np.fromiter((r.tokens_used for r in records), np.int32, n)
+        ])
+        self.processing_method = np.concatenate([
+            self.processing_method,
+            np.fromiter((_METHOD_CODES[r.processing_method] for r in records), np.int8, n)
+        ])
+
+    def row(self, i: int) -> PerformanceMetrics:
+        """Materialize row i as a PerformanceMetrics record"""
+        return PerformanceMetrics(
+            response_time_ms=int(self.response_time_ms[i]),
+            cost_usd=float(self.cost_usd[i]),
+            quality_score=float(self.quality_score[i]),
+            user_satisfaction=int(self.user_satisfaction[i]),
+            tokens_used=int(self.tokens_used[i]),
+            processing_method=_METHODS_BY_CODE[self.processing_method[i]]
+        )
+
+    def view_as_arrow(self) -> pa.Table:
+        """Zero-copy Arrow view over the columns"""
+        return pa.table({name: getattr(self, name) for name in self.__slots__})
+
+class BusinessIntelligenceBatch:
+    """
+    Structure-of-arrays batch of BusinessIntelligence metrics
+
+    Same SoA layout as PerformanceMetricsBatch: one float64 column per
+    field, with the dataclass kept as the per-row cursor API.
+    """
+
+    __slots__ = ('total_cost_savings', 'performance_improvement_percent',
+                 'roi_percent', 'user_satisfaction_avg', 'market_position_score')
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, np.empty(0, np.float64))
+
+    def __len__(self) -> int:
+        return self.roi_percent.size
+
+    def append_batch(self, records: List[BusinessIntelligence]) -> None:
+        """Append a batch of records, one concatenate per column"""
+        n = len(records)
+        if n == 0:
+            return
+        for name in self.__slots__:
+            setattr(self, name, np.concatenate([
+                getattr(self, name),
+                np.fromiter((getattr(r, name) for r in records), np.float64, n)
+            ]))
+
+    def row(self, i: int) -> BusinessIntelligence:
+        """Materialize row i as a BusinessIntelligence record"""
+        return BusinessIntelligence(
+            **{name: float(getattr(self, name)[i]) for name in self.__slots__}
+        )
+
+    def view_as_arrow(self) -> pa.Table:
+        """Zero-copy Arrow view over the columns"""
+        return pa.table({name: getattr(self, name) for name in self.__slots__})
+
+# Process-wide pools shared by every processor: one warm pool per set
+# of connection parameters keeps the total connection count under
+# server limits instead of each processor growing its own. Each pool is
+# reference-counted so only the last consumer to release it closes it.
+_shared_pools: Dict[tuple, asyncpg.Pool] = {}
+_pool_refcounts: Dict[tuple, int] = {}
+_pool_keys: Dict[int, tuple] = {}
+_pools_lock = asyncio.Lock()
+
+def _pool_key(dsn: Optional[str], pool_size: int, connect_kwargs: dict) -> tuple:
+    """Hashable identity for a pool's connection parameters"""
+    return (dsn, pool_size, tuple(sorted(connect_kwargs.items())))
+
+async def get_shared_pool(dsn: str = None, pool_size: int = 10,
+                          **connect_kwargs) -> asyncpg.Pool:
+    """
+    Return the process-wide asyncpg pool for these connection
+    parameters, creating it on first use
+
+    Pools are keyed on (dsn, pool_size, connect kwargs), so processors
+    pointed at different databases each get their own pool rather than
+    silently sharing whichever was created first. min_size equals
+    max_size so the pool is fully warm up front and no query pays the
+    TCP+TLS handshake for pool growth; idle connections are recycled
+    after five minutes and the statement cache is sized for the full
+    query set. Callers must hand the pool back via release_shared_pool.
+    Creation is serialized by a lock so two processors initializing
+    concurrently with the same key share one pool instead of racing to
+    create two and orphaning the loser.
+    """
+    key = _pool_key(dsn, pool_size, connect_kwargs)
+    async with _pools_lock:
+        pool = _shared_pools.get(key)
+        if pool is None:
+            pool = await asyncpg.create_pool(
+                dsn,
+                min_size=pool_size,
+                max_size=pool_size,
+                max_inactive_connection_lifetime=300,
+                statement_cache_size=1024,
+                command_timeout=60,
+                **connect_kwargs
+            )
+            _shared_pools[key] = pool
+            _pool_keys[id(pool)] = key
+            _pool_refcounts[key] = 0
+            logger.info("Shared database pool created with %s connections", pool_size)
+        _pool_refcounts[key] += 1
+        return pool
+
+async def release_shared_pool(pool: asyncpg.Pool):
+    """
+    Release one consumer's claim on a shared pool
+
+    The pool is only closed once every consumer that acquired it has
+    released it, so no processor can close it out from under another.
+    """
+    async with _pools_lock:
+        key = _pool_keys.get(id(pool))
+        if key is None:
+            return
+        _pool_refcounts[key] -= 1
+        if _pool_refcounts[key] > 0:
+            return
+        del _shared_pools[key]
+        del _pool_refcounts[key]
+        del _pool_keys[id(pool)]
+    await pool.close()
+    logger.info("Shared database pool closed")
+
 class DatabaseConnection:
     """Manages PostgreSQL database connections with connection pooling"""
-    
+
     def __init__(self, connection_string: str, pool_size: int = 10):
         self.connection_string = connection_string
         self.pool_size = pool_size
         self.pool = None
-        
+
     async def create_pool(self):
-        """Create database connection pool"""
+        """Attach to the shared database connection pool"""
         try:
-            self.pool = await asyncpg.create_pool(
-                self.connection_string,
-                min_size=1,
-                max_size=self.pool_size,
-                command_timeout=60
-            )
-            logger.info(f"Database pool created with {self.pool_size} connections")
+            self.pool = await get_shared_pool(self.connection_string,
+                                              self.pool_size)
+            logger.info("Database pool ready with %s connections", self.pool_size)
         except Exception as e:
-            logger.error(f"Failed to create database pool: {e}")
+            logger.error("Failed to create database pool: %s", e)
             raise
-            
+
     async def close_pool(self):
-        """Close database connection pool"""
+        """Release this processor's claim on the shared pool"""
         if self.pool:
-            await self.pool.close()
-            logger.info("Database pool closed")
+            await release_shared_pool(self.pool)
+            self.pool = None
+            logger.info("Database pool released")
 
 class BrainArchitectureProcessor:
     """Main Brain Architecture processor orchestrating all components"""
@@ -88,7 +352,7 @@ class BrainArchitectureProcessor:
             await self.db_connection.create_pool()
             logger.info("Brain Architecture Processor initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize processor: {e}")
+            logger.error("Failed to initialize processor: %s", e)
             raise
             
     async def shutdown(self):
@@ -100,48 +364,128 @@ class BrainArchitectureProcessor:
         """Comprehensive analysis of RAG vs Context Dumping performance"""
         try:
             async with self.db_connection.pool.acquire() as conn:
-                # Get comparative performance data
-                performance_data = await conn.fetch("""
-                    SELECT 
-                        processing_method,
-                        COUNT(*) as query_count,
-                        ROUND(AVG(response_time_ms), 2) as avg_response_time_ms,
-                        ROUND(AVG(cost_usd), 6) as avg_cost_usd,
-                        ROUND(AVG(rpm.quality_score), 3) as avg_quality_score,
-                        ROUND(AVG(rpm.user_satisfaction), 2) as avg_user_satisfaction
-                    FROM bronze.raw_queries rq
-                    LEFT JOIN bronze.raw_performance_metrics rpm ON rq.query_id = rpm.query_id
-                    GROUP BY processing_method
-                """)
-                
-                # Calculate performance improvements
+                # Single round trip: aggregate both methods and compute the
+                # improvement ratios server-side with FILTER clauses, so the
+                # planner uses one hash aggregate instead of Python loops
+                row = await conn.fetchrow("""
+                    WITH method_metrics AS (
+                        SELECT
+                            rq.method_id,
+                            rq.response_time_ms,
+                            rq.cost_usd,
+                            rpm.quality_score,
+                            rpm.user_satisfaction
+                        FROM bronze.raw_queries rq
+                        LEFT JOIN bronze.raw_performance_metrics rpm ON rq.query_id = rpm.query_id
+                    )
+                    SELECT
+                        COUNT(*) FILTER (WHERE method_id = $1) as rag_query_count,
+                        ROUND(AVG(response_time_ms) FILTER (WHERE method_id = $1), 2) as rag_avg_response_time_ms,
+                        ROUND(AVG(cost_usd) FILTER (WHERE method_id = $1), 6) as rag_avg_cost_usd,
+                        ROUND(AVG(quality_score) FILTER (WHERE method_id = $1), 3) as rag_avg_quality_score,
+                        ROUND(AVG(user_satisfaction) FILTER (WHERE method_id = $1), 2) as rag_avg_user_satisfaction,
+                        COUNT(*) FILTER (WHERE method_id = $2) as context_query_count,
+                        ROUND(AVG(response_time_ms) FILTER (WHERE method_id = $2), 2) as context_avg_response_time_ms,
+                        ROUND(AVG(cost_usd) FILTER (WHERE method_id = $2), 6) as context_avg_cost_usd,
+                        ROUND(AVG(quality_score) FILTER (WHERE method_id = $2), 3) as context_avg_quality_score,
+                        ROUND(AVG(user_satisfaction) FILTER (WHERE method_id = $2), 2) as context_avg_user_satisfaction,
+                        ROUND(
+                            AVG(response_time_ms) FILTER (WHERE method_id = $2) /
+                            NULLIF(AVG(response_time_ms) FILTER (WHERE method_id = $1), 0), 1
+                        ) as performance_improvement_factor,
+                        ROUND(
+                            AVG(cost_usd) FILTER (WHERE method_id = $2) /
+                            NULLIF(AVG(cost_usd) FILTER (WHERE method_id = $1), 0), 1
+                        ) as cost_reduction_factor,
+                        ROUND(
+                            (AVG(quality_score) FILTER (WHERE method_id = $1) -
+                             AVG(quality_score) FILTER (WHERE method_id = $2)) /
+                            NULLIF(AVG(quality_score) FILTER (WHERE method_id = $2), 0) * 100, 2
+                        ) as quality_improvement_percent
+                    FROM method_metrics
+                """, METHOD_IDS['RAG'], METHOD_IDS['CONTEXT_DUMP'])
+
                 results = {}
-                rag_data = next((row for row in performance_data if row['processing_method'] == 'RAG'), None)
-                context_data = next((row for row in performance_data if row['processing_method'] == 'CONTEXT_DUMP'), None)
-                
-                if rag_data and context_data:
+                if row and row['rag_query_count'] and row['context_query_count']:
                     results = {
-                        'rag_metrics': dict(rag_data),
-                        'context_dump_metrics': dict(context_data),
-                        'performance_improvement_factor': round(
-                            context_data['avg_response_time_ms'] / rag_data['avg_response_time_ms'], 1
-                        ),
-                        'cost_reduction_factor': round(
-                            context_data['avg_cost_usd'] / rag_data['avg_cost_usd'], 1
-                        ),
-                        'quality_improvement_percent': round(
-                            (rag_data['avg_quality_score'] - context_data['avg_quality_score']) / 
-                            context_data['avg_quality_score'] * 100, 2
-                        )
+                        'rag_metrics': {
+                            'processing_method': 'RAG',
+                            'query_count': row['rag_query_count'],
+                            'avg_response_time_ms': row['rag_avg_response_time_ms'],
+                            'avg_cost_usd': row['rag_avg_cost_usd'],
+                            'avg_quality_score': row['rag_avg_quality_score'],
+                            'avg_user_satisfaction': row['rag_avg_user_satisfaction']
+                        },
+                        'context_dump_metrics': {
+                            'processing_method': 'CONTEXT_DUMP',
+                            'query_count': row['context_query_count'],
+                            'avg_response_time_ms': row['context_avg_response_time_ms'],
+                            'avg_cost_usd': row['context_avg_cost_usd'],
+                            'avg_quality_score': row['context_avg_quality_score'],
+                            'avg_user_satisfaction': row['context_avg_user_satisfaction']
+                        },
+                        'performance_improvement_factor': row['performance_improvement_factor'],
+                        'cost_reduction_factor': row['cost_reduction_factor'],
+                        'quality_improvement_percent': row['quality_improvement_percent']
                     }
-                
+
                 logger.info("Performance analysis completed")
                 return results
                 
         except Exception as e:
-            logger.error(f"Failed to analyze performance: {e}")
+            logger.error("Failed to analyze performance: %s", e)
             raise
     
+    async def aggregate_per_method_metrics(self) -> Dict[str, Dict[str, float]]:
+        """
+        Client-side per-method aggregation over raw performance metrics
+
+        Used for follow-on statistics that do not fit the single SQL pass
+        in analyze_rag_vs_context_dumping. Methods are dense-encoded to
+        small ints server-side so the groupby runs over contiguous NumPy
+        columns (and a parallel numba kernel once row counts are large).
+        """
+        try:
+            async with self.db_connection.pool.acquire() as conn:
+                rows = await conn.fetch("""
+                    SELECT
+                        DENSE_RANK() OVER (ORDER BY processing_method) - 1 as method_id,
+                        processing_method,
+                        response_time_ms,
+                        COALESCE(cost_per_query_usd, 0) as cost_usd,
+                        COALESCE(quality_score, 0) as quality_score
+                    FROM bronze.raw_performance_metrics
+                """)
+
+            if not rows:
+                return {}
+
+            n = len(rows)
+            method_ids = np.fromiter((r['method_id'] for r in rows), np.int64, n)
+            response_times = np.fromiter((r['response_time_ms'] for r in rows), np.float64, n)
+            costs = np.fromiter((r['cost_usd'] for r in rows), np.float64, n)
+            qualities = np.fromiter((r['quality_score'] for r in rows), np.float64, n)
+
+            method_names = {}
+            for r in rows:
+                method_names.setdefault(r['method_id'], r['processing_method'])
+
+            means = _group_means(method_ids, response_times, costs, qualities,
+                                 len(method_names))
+
+            return {
+                name: {
+                    'avg_response_time_ms': round(means[method_id, 0], 2),
+                    'avg_cost_usd': round(means[method_id, 1], 6),
+                    'avg_quality_score': round(means[method_id, 2], 3)
+                }
+                for method_id, name in method_names.items()
+            }
+
+        except Exception as e:
+            logger.error("Failed to aggregate per-method metrics: %s", e)
+            raise
+
     async def generate_executive_summary(self) -> Dict[str, Any]:
         """Generate executive summary with key business metrics"""
         try:
@@ -156,10 +500,10 @@ class BrainArchitectureProcessor:
             quality_improvement = analysis.get('quality_improvement_percent', 0)
             
             # Calculate business value
-            roi_percent = min(performance_factor * cost_factor * 20, 900)  # Cap at 900%
+            roi_percent = _roi_percent(performance_factor, cost_factor)
             
             executive_summary = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': _iso_now(),
                 'key_achievements': {
                     'performance_improvement': f"{performance_factor}x faster than context dumping",
                     'cost_reduction': f"{cost_factor}x cost reduction achieved", 
@@ -184,7 +528,7 @@ class BrainArchitectureProcessor:
             return executive_summary
             
         except Exception as e:
-            logger.error(f"Failed to generate executive summary: {e}")
+            logger.error("Failed to generate executive summary: %s", e)
             raise
 
 async def main():
@@ -231,7 +575,7 @@ async def main():
             print("=" * 60)
         
     except Exception as e:
-        logger.error(f"Main execution failed: {e}")
+        logger.error("Main execution failed: %s", e)
         print(f"❌ Execution failed: {e}")
         
     finally:
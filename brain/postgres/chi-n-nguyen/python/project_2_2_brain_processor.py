@@ -7,44 +7,142 @@ Description: Modular Python script for Project 2.2 specification compliance
 Connects to RDS PostgreSQL and executes DDL/DML with individual functions
 """
 
-import psycopg2
-import psycopg2.extras
+import asyncio
+import asyncpg
+import atexit
+import csv
+import io
+import orjson
 import os
+import queue
+import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from typing import List, Dict, Any, Optional
-import pandas as pd
-from datetime import datetime
+import numpy as np
+import polars as pl
+import pyarrow as pa
 
-# Configure logging
+try:
+    from numba import njit
+except ImportError:  # numba is optional; NumPy path covers small inputs
+    njit = None
+
+from brain_processor import get_shared_pool, release_shared_pool, _iso_now
+
+# Configure logging: records go through an in-memory queue and a
+# background listener thread does the file/stream writes, so logging
+# never blocks the event loop on disk I/O. force=True replaces the
+# root handler that importing brain_processor already installed, which
+# would otherwise make this basicConfig a silent no-op.
+_log_queue = queue.SimpleQueue()
+_log_listener = QueueListener(
+    _log_queue,
+    logging.FileHandler('project_2_2_brain.log'),
+    logging.StreamHandler(sys.stdout)
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('project_2_2_brain.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[QueueHandler(_log_queue)],
+    force=True
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Precompiled pattern for a DML file whose only statement is one
+# multi-row INSERT INTO table (cols) VALUES (...), (...), ... block.
+# Such files can be rewritten to CSV and loaded via the COPY protocol,
+# which bypasses per-row parse/plan/bind and is typically 10-50x faster.
+INSERT_VALUES_PATTERN = re.compile(
+    r"^\s*INSERT\s+INTO\s+([\w\.]+)\s*\(([^)]*)\)\s*VALUES\s*(.+?);?\s*$",
+    re.IGNORECASE | re.DOTALL
+)
+
+# Whitelist for schema/table names interpolated into view queries
+IDENTIFIER_PATTERN = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*$')
+
+# Plain numeric SQL literal (the only unquoted values COPY-eligible
+# scripts may contain besides NULL and booleans)
+NUMERIC_LITERAL_PATTERN = re.compile(r'^-?\d+(\.\d+)?$')
+
+# NULL marker for the COPY rewrite. The CSV default treats an unquoted
+# empty field as NULL, which would silently turn SQL '' literals into
+# NULLs, so None cells are written as this marker instead
+COPY_NULL_MARKER = '\\N'
+
+# Below this size the JIT dispatch overhead outweighs the compiled loop
+_NUMBA_DISPATCH_THRESHOLD = 1024
+
+def _best_worst(ranks: np.ndarray, times: np.ndarray):
+    """
+    Locate best/worst ranked entries and their response-time ratio.
+    Operates on NumPy arrays so the scan stays out of the Python loop.
+    """
+    i_best = ranks.argmin()
+    i_worst = ranks.argmax()
+    ratio = times[i_worst] / times[i_best] if times[i_best] > 0 else 0.0
+    return i_best, i_worst, ratio
+
+# Compile the same kernel with numba for large per-model rank sets;
+# cache=True persists the compilation so later runs pay zero JIT cost
+_best_worst_jit = njit(cache=True)(_best_worst) if njit is not None else None
+
+def _select_best_worst(ranks: np.ndarray, times: np.ndarray):
+    """Dispatch between the NumPy and JIT kernels on input size"""
+    if _best_worst_jit is not None and ranks.size >= _NUMBA_DISPATCH_THRESHOLD:
+        return _best_worst_jit(ranks, times)
+    return _best_worst(ranks, times)
+
+def _arrow_column(values: List[Any]) -> pa.Array:
+    """
+    Build one Arrow array from a column of fetched values
+
+    asyncpg decodes INET/UUID columns to ipaddress/uuid objects that
+    Arrow's type inference rejects; those columns fall back to their
+    string representation instead of failing the whole preview.
+    """
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return pa.array([None if v is None else str(v) for v in values])
+
+@lru_cache(maxsize=64)
+def _load_sql(path: str, mtime: float) -> str:
+    """
+    Cache SQL script contents keyed on (path, mtime) so repeated
+    processor invocations skip the file I/O; an edited file gets a new
+    mtime and therefore a fresh cache entry
+    """
+    return Path(path).read_text()
+
 class Project22BrainProcessor:
     """
     Modular Brain Architecture processor for Project 2.2
     Implements individual functions for DDL, DML, and table viewing as per specification
+
+    Uses an asyncpg connection pool so independent scripts run concurrently:
+    file I/O for the next script overlaps the server's execution of the
+    prior one instead of serializing on a single blocking socket.
     """
-    
-    def __init__(self, rds_endpoint: str = None, database: str = "postgres", 
-                 username: str = None, password: str = None, port: int = 5432):
+
+    def __init__(self, rds_endpoint: str = None, database: str = "postgres",
+                 username: str = None, password: str = None, port: int = 5432,
+                 pool_size: int = 10):
         """
         Initialize connection to RDS PostgreSQL database
-        
+
         Args:
             rds_endpoint: RDS endpoint URL (provided in Discord)
             database: Database name
             username: Database username
-            password: Database password  
+            password: Database password
             port: Database port
+            pool_size: Maximum connections in the asyncpg pool
         """
         # Use environment variables or parameters
         self.rds_endpoint = rds_endpoint or os.getenv('RDS_ENDPOINT', 'localhost')
@@ -52,62 +150,352 @@ class Project22BrainProcessor:
         self.username = username or os.getenv('RDS_USERNAME', 'postgres')
         self.password = password or os.getenv('RDS_PASSWORD', 'password')
         self.port = port or int(os.getenv('RDS_PORT', '5432'))
-        
-        self.connection = None
+        self.pool_size = pool_size
+
+        self.pool = None
         self.base_path = Path(__file__).parent.parent
-        
-        logger.info(f"Initialized Project 2.2 Brain Processor")
-        logger.info(f"Target: {self.rds_endpoint}:{self.port}/{self.database}")
-    
-    def connect_to_database(self) -> bool:
+        # Validated view-query text per (schema, table); asyncpg's
+        # per-connection statement cache keeps the server-side plans
+        self._view_queries: Dict[tuple, str] = {}
+
+        logger.info("Initialized Project 2.2 Brain Processor")
+        logger.info("Target: %s:%s/%s", self.rds_endpoint, self.port, self.database)
+
+    async def connect_to_database(self) -> bool:
         """
-        Establish connection to RDS PostgreSQL database
-        
+        Establish connection pool to RDS PostgreSQL database
+
         Returns:
             bool: True if connection successful, False otherwise
         """
         try:
-            self.connection = psycopg2.connect(
+            # Attach to the process-wide pool shared with the Brain
+            # Architecture processor; min_size == max_size keeps every
+            # connection warm from the first query
+            self.pool = await get_shared_pool(
+                pool_size=self.pool_size,
                 host=self.rds_endpoint,
                 database=self.database,
                 user=self.username,
                 password=self.password,
                 port=self.port,
-                connect_timeout=30
+                timeout=30
             )
-            self.connection.autocommit = True
             logger.info("✅ Successfully connected to RDS PostgreSQL database")
             return True
-            
-        except psycopg2.Error as e:
-            logger.error(f"❌ Failed to connect to database: {e}")
+
+        except asyncpg.PostgresError as e:
+            logger.error("❌ Failed to connect to database: %s", e)
+            return False
+        except Exception as e:
+            logger.error("❌ Unexpected error during connection: %s", e)
+            return False
+
+    @staticmethod
+    def _split_sql_tuples(values_sql: str) -> Optional[List[str]]:
+        """
+        Split a VALUES clause into its individual (...) tuple bodies,
+        respecting quoted strings and nested parentheses
+
+        Returns None if anything other than whitespace or commas appears
+        between the tuples at the top level -- e.g. a second statement
+        following the INSERT -- so the caller never COPYs unrelated SQL
+        text into the table as data.
+        """
+        tuples = []
+        current = []
+        depth = 0
+        in_quote = False
+        i = 0
+        while i < len(values_sql):
+            ch = values_sql[i]
+            if in_quote:
+                current.append(ch)
+                if ch == "'":
+                    # Doubled quote is an escaped quote inside the literal
+                    if i + 1 < len(values_sql) and values_sql[i + 1] == "'":
+                        current.append("'")
+                        i += 1
+                    else:
+                        in_quote = False
+            elif ch == "'":
+                if depth == 0:
+                    return None
+                in_quote = True
+                current.append(ch)
+            elif ch == '(':
+                depth += 1
+                if depth > 1:
+                    current.append(ch)
+            elif ch == ')':
+                depth -= 1
+                if depth == 0:
+                    tuples.append(''.join(current))
+                    current = []
+                else:
+                    current.append(ch)
+            elif depth > 0:
+                current.append(ch)
+            elif ch != ',' and not ch.isspace():
+                # Top-level text that is not a tuple separator: this is
+                # not a pure multi-row VALUES list
+                return None
+            i += 1
+        if depth != 0 or in_quote:
+            return None
+        return tuples
+
+    @staticmethod
+    def _sql_literal_to_csv(literal: str) -> Optional[str]:
+        """
+        Convert one plain SQL literal to its CSV cell value (None for NULL)
+
+        Raises ValueError for anything that is not a plain literal --
+        typed casts like '...'::uuid, function calls, array syntax --
+        which makes the caller skip the COPY rewrite and execute the
+        INSERT as-is rather than load mangled values.
+        """
+        literal = literal.strip()
+        upper = literal.upper()
+        if upper == 'NULL':
+            return None
+        if upper in ('TRUE', 'FALSE'):
+            return upper.lower()
+        if len(literal) >= 2 and literal.startswith("'") and literal.endswith("'"):
+            body = literal[1:-1]
+            # Quotes inside the body must all be doubled escapes;
+            # anything else means the literal has a trailing cast or
+            # concatenation we cannot represent in CSV
+            if "'" not in body.replace("''", ""):
+                return body.replace("''", "'")
+            raise ValueError(f"not a plain SQL literal: {literal!r}")
+        if NUMERIC_LITERAL_PATTERN.match(literal):
+            return literal
+        raise ValueError(f"not a plain SQL literal: {literal!r}")
+
+    def _tuple_to_csv_row(self, tuple_body: str) -> List[Optional[str]]:
+        """Split one tuple body into CSV cells (commas outside quotes)"""
+        fields = []
+        current = []
+        depth = 0
+        in_quote = False
+        for i, ch in enumerate(tuple_body):
+            if in_quote:
+                current.append(ch)
+                if ch == "'" and not (i + 1 < len(tuple_body) and tuple_body[i + 1] == "'"):
+                    in_quote = False
+            elif ch == "'":
+                in_quote = True
+                current.append(ch)
+            elif ch in '([':
+                depth += 1
+                current.append(ch)
+            elif ch in ')]':
+                depth -= 1
+                current.append(ch)
+            elif ch == ',' and depth == 0:
+                fields.append(self._sql_literal_to_csv(''.join(current)))
+                current = []
+            else:
+                current.append(ch)
+        fields.append(self._sql_literal_to_csv(''.join(current)))
+        return fields
+
+    async def _try_copy_insert(self, conn, sql_content: str) -> bool:
+        """
+        If a DML script is a single multi-row INSERT, stage it as CSV
+        in memory and load it through COPY instead of executing row-wise
+        INSERTs. Returns True if the script was handled via COPY.
+        """
+        # Strip line comments before pattern matching
+        stripped = re.sub(r'--[^\n]*', '', sql_content).strip()
+        match = INSERT_VALUES_PATTERN.match(stripped)
+        if not match:
+            return False
+
+        table, columns, values_sql = match.groups()
+        tuples = self._split_sql_tuples(values_sql)
+        if not tuples:
+            return False
+
+        # Convert every tuple up front; bail out to plain execution if
+        # any value is not a plain literal or a row is ragged
+        column_list = [col.strip() for col in columns.split(',')]
+        try:
+            csv_rows = [self._tuple_to_csv_row(body) for body in tuples]
+        except ValueError:
+            logger.debug("Script not COPY-eligible (non-plain literal); executing as-is")
+            return False
+        if any(len(fields) != len(column_list) for fields in csv_rows):
+            logger.debug("Script not COPY-eligible (ragged rows); executing as-is")
+            return False
+        # A real string equal to the NULL marker would be written
+        # unquoted and misread as NULL -- too unlikely to special-case,
+        # so fall back to plain execution
+        if any(field == COPY_NULL_MARKER for fields in csv_rows for field in fields):
+            logger.debug("Script not COPY-eligible (value collides with NULL marker); executing as-is")
+            return False
+
+        # Stage rows as an in-memory CSV buffer; NULLs become the
+        # explicit marker so empty strings stay empty strings
+        text_buffer = io.StringIO()
+        writer = csv.writer(text_buffer)
+        for fields in csv_rows:
+            writer.writerow(
+                COPY_NULL_MARKER if field is None else field for field in fields
+            )
+
+        schema_name, _, table_name = table.rpartition('.')
+        await conn.copy_to_table(
+            table_name,
+            source=io.BytesIO(text_buffer.getvalue().encode()),
+            schema_name=schema_name or None,
+            columns=column_list,
+            format='csv',
+            null=COPY_NULL_MARKER
+        )
+        logger.info("✅ Bulk loaded %s rows into %s via COPY", len(tuples), table)
+        return True
+
+    async def bulk_load(self, table: str, csv_path: str) -> bool:
+        """
+        Bulk load a CSV file into a table using the COPY protocol
+
+        COPY uses the bulk wire protocol and issues far fewer WAL records
+        per tuple than row-wise INSERTs, so it is the fastest load path.
+
+        Args:
+            table: Fully qualified table name (e.g. project_two.chi_n_nguyen)
+            csv_path: Path to a CSV file with a header row
+
+        Returns:
+            bool: True if load successful, False otherwise
+        """
+        logger.info("📦 Bulk loading %s into %s via COPY", csv_path, table)
+
+        if not self.pool:
+            logger.error("No database connection available")
+            return False
+
+        try:
+            schema_name, _, table_name = table.rpartition('.')
+            async with self.pool.acquire() as conn:
+                async with conn.transaction():
+                    with open(csv_path, 'rb') as f:
+                        await conn.copy_to_table(
+                            table_name,
+                            source=f,
+                            schema_name=schema_name or None,
+                            format='csv',
+                            header=True
+                        )
+            logger.info("✅ Bulk load into %s completed", table)
+            return True
+
+        except asyncpg.PostgresError as e:
+            logger.error("❌ Bulk load into %s failed: %s", table, e)
             return False
         except Exception as e:
-            logger.error(f"❌ Unexpected error during connection: {e}")
+            logger.error("❌ Unexpected error during bulk load: %s", e)
             return False
-    
-    def run_ddl(self, ddl_file: str = None) -> bool:
+
+    async def _read_script(self, script_path: str) -> Optional[str]:
+        """Read a script file (cached on mtime) without blocking the event loop"""
+        full_path = self.base_path / script_path
+        if not full_path.exists():
+            logger.warning("Script file not found: %s", full_path)
+            return None
+        return await asyncio.to_thread(
+            lambda: _load_sql(str(full_path), full_path.stat().st_mtime)
+        )
+
+    async def _exec_file(self, script_path: str, phase: str) -> bool:
+        """
+        Execute one script file on its own pooled connection, so
+        independent scripts overlap network and server execution
+        """
+        content = await self._read_script(script_path)
+        if content is None:
+            return True
+
+        logger.info("Executing %s: %s", phase, script_path)
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                if phase == 'DML' and await self._try_copy_insert(conn, content):
+                    return True
+                await conn.execute(content)
+        logger.info("✅ Successfully executed %s: %s", phase, script_path)
+        return True
+
+    async def _execute_script_files(self, script_files: List[str], phase: str) -> bool:
+        """
+        Execute a list of SQL script files as ONE batch
+
+        All files are concatenated into a single SQL buffer and submitted
+        with one execute inside an explicit transaction, so the server
+        sees one batch and one commit instead of a network round-trip
+        plus implicit commit per file. Scripts that must run in order
+        (DDL) use this path; independent scripts can use _exec_file with
+        asyncio.gather instead.
+
+        Args:
+            script_files: Script paths relative to the project base path
+            phase: Label for logging ('DDL' or 'DML')
+
+        Returns:
+            bool: True if execution successful, False otherwise
+        """
+        # Read every file up front and build a single SQL batch
+        contents = []
+        for script_path in script_files:
+            content = await self._read_script(script_path)
+            if content is None:
+                continue
+            logger.info("Queuing %s script: %s", phase, script_path)
+            contents.append(content.rstrip().rstrip(';'))
+
+        if not contents:
+            logger.warning("No %s scripts found to execute", phase)
+            return True
+
+        # Single transaction: COPY-eligible DML goes through the bulk
+        # protocol, everything else is executed as one concatenated batch
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                remaining = []
+                for content in contents:
+                    if phase == 'DML' and await self._try_copy_insert(conn, content):
+                        continue
+                    remaining.append(content)
+
+                if remaining:
+                    await conn.execute(";\n".join(remaining))
+
+        logger.info("✅ Executed %s %s scripts in one batch", len(contents), phase)
+        return True
+
+    async def run_ddl(self, ddl_file: str = None) -> bool:
         """
         Execute DDL scripts to create tables and schemas
         Individual function for DDL execution as per Project 2.2 specification
-        
+
+        DDL is order-dependent (schemas before tables), so scripts stay
+        chained in one batched transaction rather than running concurrently.
+
         Args:
             ddl_file: Specific DDL file to run (optional)
-            
+
         Returns:
             bool: True if DDL execution successful, False otherwise
         """
         logger.info("��️  Starting DDL execution (CREATE TABLE operations)")
-        
-        if not self.connection:
+
+        if not self.pool:
             logger.error("No database connection available")
             return False
-        
+
         try:
-            cursor = self.connection.cursor()
-            
             # Define DDL files to execute
-            ddl_files = []
             if ddl_file:
                 ddl_files = [ddl_file]
             else:
@@ -116,56 +504,47 @@ class Project22BrainProcessor:
                     'DDL/chi_n_nguyen_table.sql',
                     'DDL/chi_n_nguyen_analytics.sql'
                 ]
-            
-            for ddl_file_path in ddl_files:
-                full_path = self.base_path / ddl_file_path
-                
-                if not full_path.exists():
-                    logger.warning(f"DDL file not found: {full_path}")
-                    continue
-                
-                logger.info(f"Executing DDL: {ddl_file_path}")
-                
-                with open(full_path, 'r') as file:
-                    ddl_content = file.read()
-                
-                # Execute DDL script
-                cursor.execute(ddl_content)
-                logger.info(f"✅ Successfully executed DDL: {ddl_file_path}")
-            
-            cursor.close()
+
+            if not await self._execute_script_files(ddl_files, 'DDL'):
+                return False
+
             logger.info("🎉 DDL execution completed successfully")
             return True
-            
-        except psycopg2.Error as e:
-            logger.error(f"❌ DDL execution failed: {e}")
+
+        except asyncpg.PostgresError as e:
+            logger.error("❌ DDL execution failed: %s", e)
             return False
         except Exception as e:
-            logger.error(f"❌ Unexpected error during DDL execution: {e}")
+            logger.error("❌ Unexpected error during DDL execution: %s", e)
             return False
-    
-    def run_dml(self, dml_file: str = None) -> bool:
+
+    async def run_dml(self, dml_file: str = None, concurrent: bool = False) -> bool:
         """
         Execute DML scripts to insert data into tables
         Individual function for DML execution as per Project 2.2 specification
-        
+
+        The default scripts are order-dependent (the analytics load
+        SELECTs from the freshly truncated and reloaded main table), so
+        they run sequentially as one batched transaction. Pass
+        concurrent=True only for scripts that really are independent;
+        those overlap on separate pooled connections via asyncio.gather.
+
         Args:
             dml_file: Specific DML file to run (optional)
-            
+            concurrent: Overlap scripts on separate connections (opt-in;
+                only safe when the scripts do not depend on each other)
+
         Returns:
             bool: True if DML execution successful, False otherwise
         """
         logger.info("📝 Starting DML execution (INSERT DATA operations)")
-        
-        if not self.connection:
+
+        if not self.pool:
             logger.error("No database connection available")
             return False
-        
+
         try:
-            cursor = self.connection.cursor()
-            
             # Define DML files to execute
-            dml_files = []
             if dml_file:
                 dml_files = [dml_file]
             else:
@@ -174,184 +553,230 @@ class Project22BrainProcessor:
                     'DML/chi_n_nguyen_data.sql',
                     'DML/chi_n_nguyen_analytics_data.sql'
                 ]
-            
-            for dml_file_path in dml_files:
-                full_path = self.base_path / dml_file_path
-                
-                if not full_path.exists():
-                    logger.warning(f"DML file not found: {full_path}")
-                    continue
-                
-                logger.info(f"Executing DML: {dml_file_path}")
-                
-                with open(full_path, 'r') as file:
-                    dml_content = file.read()
-                
-                # Execute DML script
-                cursor.execute(dml_content)
-                logger.info(f"✅ Successfully executed DML: {dml_file_path}")
-            
-            cursor.close()
+
+            if concurrent:
+                tasks = [self._exec_file(path, 'DML') for path in dml_files]
+                await asyncio.gather(*tasks)
+            elif not await self._execute_script_files(dml_files, 'DML'):
+                return False
+
             logger.info("🎉 DML execution completed successfully")
             return True
-            
-        except psycopg2.Error as e:
-            logger.error(f"❌ DML execution failed: {e}")
+
+        except asyncpg.PostgresError as e:
+            logger.error("❌ DML execution failed: %s", e)
             return False
         except Exception as e:
-            logger.error(f"❌ Unexpected error during DML execution: {e}")
+            logger.error("❌ Unexpected error during DML execution: %s", e)
             return False
-    
-    def view_table(self, table_name: str = "chi_n_nguyen", limit: int = 10, 
-                   schema: str = "project_two") -> Optional[pd.DataFrame]:
+
+    async def view_table(self, table_name: str = "chi_n_nguyen", limit: int = 10,
+                         schema: str = "project_two",
+                         as_pandas: bool = False) -> Optional[Any]:
         """
         View data from a given table
         Individual function for table viewing as per Project 2.2 specification
-        
+
         Args:
             table_name: Name of table to view
             limit: Number of rows to return
             schema: Schema name
-            
+            as_pandas: Return a pandas DataFrame instead of polars
+
         Returns:
-            pd.DataFrame: Table data or None if error
+            pl.DataFrame (or pd.DataFrame if as_pandas): Table data, None if error
         """
-        logger.info(f"👀 Viewing table: {schema}.{table_name} (limit: {limit})")
-        
-        if not self.connection:
+        logger.info("👀 Viewing table: %s.%s (limit: %s)", schema, table_name, limit)
+
+        if not self.pool:
             logger.error("No database connection available")
             return None
-        
+
+        # asyncpg requires cursor prefetch > 0, so a non-positive limit
+        # would raise InterfaceError; there is nothing to show anyway
+        if limit <= 0:
+            logger.warning("No data found in %s.%s", schema, table_name)
+            return None
+
         try:
-            cursor = self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-            
-            # Query table data
-            query = f"""
-                SELECT * 
-                FROM {schema}.{table_name} 
-                ORDER BY created_at DESC 
-                LIMIT %s
-            """
-            
-            cursor.execute(query, (limit,))
-            rows = cursor.fetchall()
-            
+            # Build the query text once per (schema, table): identifiers
+            # are whitelist-validated before interpolation, and reusing
+            # the exact same text lets asyncpg's statement cache skip the
+            # server-side parse/analyze/plan on repeated calls
+            key = (schema, table_name)
+            query = self._view_queries.get(key)
+            if query is None:
+                if not (IDENTIFIER_PATTERN.match(schema)
+                        and IDENTIFIER_PATTERN.match(table_name)):
+                    logger.error("❌ Invalid identifier: %s.%s", schema, table_name)
+                    return None
+                query = (
+                    f'SELECT * FROM "{schema}"."{table_name}" '
+                    f'ORDER BY created_at DESC LIMIT $1'
+                )
+                self._view_queries[key] = query
+
+            # Server-side cursor: rows stream in prefetch-sized batches
+            # instead of the whole result set buffering client-side, so
+            # peak memory stays bounded even for large limits
+            rows = []
+            async with self.pool.acquire() as conn:
+                stmt = await conn.prepare(query)
+                async with conn.transaction():
+                    async for record in stmt.cursor(limit, prefetch=min(limit, 1000)):
+                        rows.append(record)
+                        if len(rows) >= limit:
+                            break
+
             if not rows:
-                logger.warning(f"No data found in {schema}.{table_name}")
+                logger.warning("No data found in %s.%s", schema, table_name)
                 return None
-            
-            # Convert to DataFrame for better display
-            df = pd.DataFrame(rows)
-            
-            logger.info(f"✅ Retrieved {len(df)} rows from {schema}.{table_name}")
+
+            # Columnar conversion: build one Arrow array per column instead
+            # of a Python dict per row, so type inference happens once and
+            # the Arrow buffers are shared zero-copy with polars/pandas
+            column_names = list(rows[0].keys())
+            arrow_table = pa.table({
+                name: _arrow_column([row[name] for row in rows])
+                for name in column_names
+            })
+
+            # Polars wraps the Arrow buffers directly and its bounded-width
+            # formatter only stringifies the rows it actually displays
+            pl_df = pl.from_arrow(arrow_table)
+
+            logger.info("✅ Retrieved %s rows from %s.%s", len(pl_df), schema, table_name)
             logger.info("📊 Table Preview:")
             print(f"\n{'-'*80}")
             print(f"TABLE: {schema}.{table_name}")
             print(f"{'-'*80}")
-            print(df.to_string(max_rows=10, max_cols=8, width=None))
+            print(pl_df.head(limit))
             print(f"{'-'*80}\n")
-            
-            cursor.close()
-            return df
-            
-        except psycopg2.Error as e:
-            logger.error(f"❌ Failed to view table {schema}.{table_name}: {e}")
+
+            if as_pandas:
+                # split_blocks keeps one block per column so Arrow shares
+                # buffers instead of consolidating into a BlockManager copy
+                return arrow_table.to_pandas(split_blocks=True)
+            return pl_df
+
+        except asyncpg.PostgresError as e:
+            logger.error("❌ Failed to view table %s.%s: %s", schema, table_name, e)
             return None
         except Exception as e:
-            logger.error(f"❌ Unexpected error viewing table: {e}")
+            logger.error("❌ Unexpected error viewing table: %s", e)
             return None
-    
-    def get_performance_analysis(self) -> Optional[Dict[str, Any]]:
+
+    async def get_performance_analysis(self) -> Optional[Dict[str, Any]]:
         """
         Get Brain Architecture performance analysis from analytics table
         Demonstrates the bonus downstream analytics functionality
-        
+
         Returns:
             Dict with performance analysis results
         """
         logger.info("📈 Generating Brain Architecture performance analysis")
-        
-        if not self.connection:
+
+        if not self.pool:
             logger.error("No database connection available")
             return None
-        
+
         try:
-            cursor = self.connection.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
-            
-            # Get method comparison data
-            cursor.execute("""
-                SELECT 
-                    context_method,
-                    total_interactions,
-                    avg_response_time_ms,
-                    avg_cost_usd,
-                    avg_quality_score,
-                    success_rate_percent,
-                    performance_rank
-                FROM project_two.chi_n_nguyen_analytics
-                ORDER BY performance_rank ASC
-            """)
-            
-            method_comparison = cursor.fetchall()
-            
-            # Get best and worst performers
-            cursor.execute("""
-                SELECT 'BEST' as category, context_method, model_name, avg_response_time_ms, avg_cost_usd
-                FROM project_two.chi_n_nguyen_analytics
-                WHERE performance_rank = 1
-                UNION ALL
-                SELECT 'WORST' as category, context_method, model_name, avg_response_time_ms, avg_cost_usd
-                FROM project_two.chi_n_nguyen_analytics
-                ORDER BY performance_rank DESC
-                LIMIT 2
-            """)
-            
-            performers = cursor.fetchall()
-            
-            cursor.close()
-            
-            # Calculate improvement factor
-            best_time = next((p['avg_response_time_ms'] for p in performers if p['category'] == 'BEST'), 1)
-            worst_time = next((p['avg_response_time_ms'] for p in performers if p['category'] == 'WORST'), 1)
-            improvement_factor = round(worst_time / best_time, 1) if best_time > 0 else 0
-            
+            # Both result sets in ONE round trip: the CTEs compute the
+            # method comparison and best/worst performers server-side and
+            # return them as two jsonb arrays in a single row
+            async with self.pool.acquire() as conn:
+                row = await conn.fetchrow("""
+                    WITH mc AS (
+                        SELECT
+                            context_method,
+                            total_interactions,
+                            avg_response_time_ms,
+                            avg_cost_usd,
+                            avg_quality_score,
+                            success_rate_percent,
+                            performance_rank
+                        FROM project_two.chi_n_nguyen_analytics
+                    ),
+                    bw AS (
+                        SELECT
+                            CASE WHEN performance_rank = 1 THEN 'BEST' ELSE 'WORST' END as category,
+                            context_method,
+                            model_name,
+                            avg_response_time_ms,
+                            avg_cost_usd
+                        FROM project_two.chi_n_nguyen_analytics
+                        WHERE performance_rank IN (
+                            1,
+                            (SELECT MAX(performance_rank) FROM project_two.chi_n_nguyen_analytics)
+                        )
+                    )
+                    SELECT
+                        (SELECT jsonb_agg(to_jsonb(mc) ORDER BY mc.performance_rank) FROM mc) as methods,
+                        (SELECT jsonb_agg(to_jsonb(bw)) FROM bw) as performers
+                """)
+
+            # asyncpg returns jsonb columns as text; orjson parses it in C
+            method_comparison = orjson.loads(row['methods']) if row['methods'] else []
+            performers = orjson.loads(row['performers']) if row['performers'] else []
+
+            # Calculate improvement factor on NumPy arrays: stays O(n) in
+            # compiled code even if the rank set grows to per-model rows
+            if method_comparison:
+                ranks = np.asarray(
+                    [m['performance_rank'] for m in method_comparison], dtype=np.int64
+                )
+                times = np.asarray(
+                    [m['avg_response_time_ms'] for m in method_comparison], dtype=np.float64
+                )
+                _, _, ratio = _select_best_worst(ranks, times)
+                improvement_factor = round(float(ratio), 1)
+            else:
+                improvement_factor = 0
+
+            # orjson.loads already produced plain dicts; no per-row copies
             analysis = {
-                'timestamp': datetime.now().isoformat(),
-                'method_comparison': [dict(row) for row in method_comparison],
-                'best_performer': next((dict(p) for p in performers if p['category'] == 'BEST'), None),
-                'worst_performer': next((dict(p) for p in performers if p['category'] == 'WORST'), None),
+                'timestamp': _iso_now(),
+                'method_comparison': method_comparison,
+                'best_performer': next((p for p in performers if p['category'] == 'BEST'), None),
+                'worst_performer': next((p for p in performers if p['category'] == 'WORST'), None),
                 'improvement_factor': improvement_factor,
                 'total_methods_analyzed': len(method_comparison)
             }
-            
-            # Display analysis
-            print(f"\n{'='*60}")
-            print("🧠 BRAIN ARCHITECTURE PERFORMANCE ANALYSIS")
-            print(f"{'='*60}")
-            
-            for method in method_comparison:
-                print(f"Method: {method['context_method']:<12} | "
-                      f"Rank: #{method['performance_rank']:<2} | "
-                      f"Time: {method['avg_response_time_ms']:>6.0f}ms | "
-                      f"Cost: ${method['avg_cost_usd']:>8.6f} | "
-                      f"Quality: {method['avg_quality_score']:>4.2f}")
-            
-            print(f"\n🏆 Performance Improvement: {improvement_factor}x faster (best vs worst)")
-            print(f"{'='*60}\n")
-            
+
+            # Display analysis: assemble every line first and flush the
+            # whole report with one write instead of one locking
+            # print/syscall per method row
+            lines = [
+                f"\n{'='*60}",
+                "🧠 BRAIN ARCHITECTURE PERFORMANCE ANALYSIS",
+                f"{'='*60}"
+            ]
+            lines.extend(
+                f"Method: {method['context_method']:<12} | "
+                f"Rank: #{method['performance_rank']:<2} | "
+                f"Time: {method['avg_response_time_ms']:>6.0f}ms | "
+                f"Cost: ${method['avg_cost_usd']:>8.6f} | "
+                f"Quality: {method['avg_quality_score']:>4.2f}"
+                for method in method_comparison
+            )
+            lines.append(f"\n🏆 Performance Improvement: {improvement_factor}x faster (best vs worst)")
+            lines.append(f"{'='*60}\n")
+            sys.stdout.write("\n".join(lines) + "\n")
+
             return analysis
-            
+
         except Exception as e:
-            logger.error(f"❌ Failed to generate performance analysis: {e}")
+            logger.error("❌ Failed to generate performance analysis: %s", e)
             return None
-    
-    def close_connection(self):
-        """Close database connection"""
-        if self.connection:
-            self.connection.close()
+
+    async def close_connection(self):
+        """Release this processor's claim on the shared connection pool"""
+        if self.pool:
+            await release_shared_pool(self.pool)
+            self.pool = None
             logger.info("🔒 Database connection closed")
 
-def main():
+async def main():
     """
     Main execution function demonstrating Project 2.2 requirements
     """
@@ -360,7 +785,7 @@ def main():
     print("Modular Python implementation for RDS PostgreSQL")
     print("Individual functions for DDL, DML, and table viewing")
     print("=" * 60)
-    
+
     # Initialize processor (configure with actual RDS endpoint from Discord)
     processor = Project22BrainProcessor(
         rds_endpoint="your-rds-endpoint-from-discord.amazonaws.com",  # Update with actual endpoint
@@ -368,41 +793,41 @@ def main():
         username="your_username",  # Update with actual credentials
         password="your_password"   # Update with actual credentials
     )
-    
+
     try:
         # Step 1: Connect to RDS database
-        if not processor.connect_to_database():
+        if not await processor.connect_to_database():
             logger.error("Failed to connect to database. Exiting.")
             return
-        
+
         # Step 2: Run DDL (CREATE TABLE operations)
         logger.info("Step 1: Executing DDL scripts...")
-        if processor.run_ddl():
+        if await processor.run_ddl():
             logger.info("✅ DDL execution completed")
         else:
             logger.error("❌ DDL execution failed")
             return
-        
+
         # Step 3: Run DML (INSERT DATA operations)
         logger.info("Step 2: Executing DML scripts...")
-        if processor.run_dml():
+        if await processor.run_dml():
             logger.info("✅ DML execution completed")
         else:
             logger.error("❌ DML execution failed")
             return
-        
-        # Step 4: View main table (chi_n_nguyen)
-        logger.info("Step 3: Viewing main table...")
-        main_table_data = processor.view_table("chi_n_nguyen", limit=5)
-        
-        # Step 5: View bonus analytics table
-        logger.info("Step 4: Viewing bonus analytics table...")
-        analytics_data = processor.view_table("chi_n_nguyen_analytics", limit=5)
-        
-        # Step 6: Generate performance analysis
-        logger.info("Step 5: Generating performance analysis...")
-        analysis = processor.get_performance_analysis()
-        
+
+        # Steps 4-6: the table previews and the performance analysis are
+        # independent of each other, so submit all three in one gather;
+        # each runs on its own pooled connection and the Postgres side
+        # works across multiple backends instead of one round trip at a
+        # time
+        logger.info("Steps 3-5: Viewing tables and generating analysis...")
+        main_table_data, analytics_data, analysis = await asyncio.gather(
+            processor.view_table("chi_n_nguyen", limit=5),
+            processor.view_table("chi_n_nguyen_analytics", limit=5),
+            processor.get_performance_analysis()
+        )
+
         # Summary
         print("\n" + "="*60)
         print("🎉 PROJECT 2.2 EXECUTION COMPLETED SUCCESSFULLY!")
@@ -419,12 +844,12 @@ def main():
         print("   • Complete Medallion Architecture implementation")
         print("   • RAG vs Context Dumping comparison")
         print("="*60)
-        
+
     except Exception as e:
-        logger.error(f"❌ Main execution failed: {e}")
-    
+        logger.error("❌ Main execution failed: %s", e)
+
     finally:
-        processor.close_connection()
+        await processor.close_connection()
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())